@@ -1,6 +1,7 @@
 from collections.abc import Collection, Set
 from dataclasses import dataclass
 from functools import cached_property
+from itertools import chain
 
 from ..common import Address
 
@@ -35,11 +36,13 @@ class Entrypoints:
 
     @cached_property
     def addresses(self) -> Set[Address]:
-        return {
-            self.main.address,
-            *(
-                entrypoint.address
-                for exception_priority_group in self.exception_priority_groups
-                for entrypoint in exception_priority_group.entrypoints
-            ),
-        }
+        return frozenset(
+            chain(
+                [self.main.address],
+                (
+                    entrypoint.address
+                    for exception_priority_group in self.exception_priority_groups
+                    for entrypoint in exception_priority_group.entrypoints
+                ),
+            )
+        )
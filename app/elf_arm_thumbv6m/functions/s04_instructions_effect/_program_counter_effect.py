@@ -4,6 +4,8 @@ from functools import partial
 
 from ...common import Address
 from ...instructions_decoder.model import (
+    REGISTER3_BY_REGISTER4,
+    REGISTER4_BY_REGISTER3,
     BaseInstructionLdrImmediate,
     Condition,
     Instruction,
@@ -104,7 +106,7 @@ def resolve(
 
         case InstructionBT1():
             # current position + branch-pc offset (4) + instruction immediate
-            target_function_offset = cursor_function_region_instructions.function_offset() + 4 + instruction.imm * 2
+            target_function_offset = cursor_function_region_instructions.function_offset() + 4 + instruction.imm
 
             return EffectBranch(
                 conditional=instruction.cond is not Condition.AL,  # this will always be true, AL is forbidden
@@ -112,7 +114,7 @@ def resolve(
             )
         case InstructionBT2():
             # current position + branch-pc offset (4) + instruction immediate
-            target_function_offset = cursor_function_region_instructions.function_offset() + 4 + instruction.imm * 2
+            target_function_offset = cursor_function_region_instructions.function_offset() + 4 + instruction.imm
 
             return EffectBranch(
                 conditional=False,
@@ -252,7 +254,7 @@ def resolve_add_register_t2_pc_offset_table(
             assert instruction.dn is Register4.PC
 
             # extract the register, cast it to Register3 (all other functions can operate on 3-bit only)
-            register = instruction.m.to_register3()
+            register = REGISTER3_BY_REGISTER4[instruction.m]
             if register is None:
                 # is not R0-R7?
                 return None
@@ -296,11 +298,11 @@ def resolve_add_register_t2_pc_offset_table(
                 return None
             if instruction_ldr.n is not register:
                 return None
-            if instruction_ldr.imm * instruction_ldr.load_size() != 4:
+            if instruction_ldr.imm != 4:
                 return None
 
             # extract load size
-            load_size = instruction_ldr.load_size()
+            load_size = instruction_ldr.load_size
         case _:
             # other instruction
             return None
@@ -316,7 +318,7 @@ def resolve_add_register_t2_pc_offset_table(
             # we've got ADD
 
             # arguments must match our patter
-            if instructions_add.dn is not Register4.from_register3(register):
+            if instructions_add.dn is not REGISTER4_BY_REGISTER3[register]:
                 return None
             if instructions_add.m is not Register4.PC:
                 return None
@@ -406,7 +408,7 @@ def resolve_bl_t1(cursor_function_region_instructions: CursorFunctionRegionInstr
         case InstructionBlT1():
             # if we land inside the same function, lets treat it as a branch. if we land outside, lets treat it as a
             # call
-            target_instruction_offset = 4 + instruction.imm * 2
+            target_instruction_offset = 4 + instruction.imm
 
             # check if we land inside the same function
             target_function_offset = cursor_function_region_instructions.function_offset() + target_instruction_offset
@@ -524,11 +526,11 @@ def resolve_blx_register_t1_pc_relative_load(
     match instructions_modifying:
         case InstructionLdrLiteralT1():
             # target register must be our branch sources
-            assert Register4.from_register3(instructions_modifying.t) == instruction.m
+            assert REGISTER4_BY_REGISTER3[instructions_modifying.t] == instruction.m
 
             # relative to current instruction address + 4 (instruction spec) + instruction immediate
             data_function_offset = (
-                cursor_function_region_instructions_modifying.function_offset() + 4 + instructions_modifying.imm * 4
+                cursor_function_region_instructions_modifying.function_offset() + 4 + instructions_modifying.imm
             )
 
             # resolve data region containing target address
@@ -606,7 +608,7 @@ def resolve_mov_register_t1_pc_adr_table(
             assert instruction.d is Register4.PC
 
             # extract the register, cast it to Register3 (all other instructions operate on 3-bit only)
-            register_index = instruction.m.to_register3()
+            register_index = REGISTER3_BY_REGISTER4[instruction.m]
             if register_index is None:
                 # is not R0-R7?
                 return None
@@ -647,7 +649,7 @@ def resolve_mov_register_t1_pc_adr_table(
                 instruction_ldr_affected_registers3 = {
                     affected_register3
                     for affected_register in instruction_ldr.affects_registers()
-                    if (affected_register3 := affected_register.to_register3()) is not None
+                    if (affected_register3 := REGISTER3_BY_REGISTER4[affected_register]) is not None
                 }
                 if register_index in instruction_ldr_affected_registers3:
                     return None
@@ -695,7 +697,7 @@ def resolve_mov_register_t1_pc_adr_table(
     # instruction pattern matches, now resolve the data table address from ADR
     data_function_offset = (
         (cursor_function_region_instructions_adr.function_offset() + 4) & ~0b11
-    ) + instruction_adr.imm * 4  # Align(PC, 4)
+    ) + instruction_adr.imm  # Align(PC, 4)
 
     # resolve data region containing the jump table
     cursor_function_region_data = cursor_function_region_instructions.cursor_function.region_data(data_function_offset)
@@ -41,7 +41,7 @@ def resolve(cursor_function_region_instructions: CursorFunctionRegionInstruction
 
     match instruction:
         case InstructionAddSpPlusImmediateT2():
-            return Effect(instruction.imm * 4)
+            return Effect(instruction.imm)
         case InstructionAddSpPlusRegisterT1():
             if instruction.dm is Register4.SP:
                 # SP = SP + SP ???
@@ -76,7 +76,7 @@ def resolve(cursor_function_region_instructions: CursorFunctionRegionInstruction
 
             return None
         case InstructionSubSpMinusImmediateT1():
-            return Effect(instruction.imm * -4)
+            return Effect(-instruction.imm)
         case _:
             # other instructions should not have affect on SP. if they have - we've missed something in this list
             assert Register4.SP not in instruction.affects_registers()
@@ -1,5 +1,5 @@
 from collections.abc import Collection, Mapping, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from itertools import pairwise
 
@@ -9,7 +9,7 @@ from ...common import Address
 from ...instructions_decoder.model import Instruction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FunctionInstructionProgramCounterEffectFlow:
     # None here means an invalid instruction. at this point they may exist (eg. mov r8, r8 used as last instruction for
     # padding, but control will never reach it).
@@ -22,7 +22,7 @@ class FunctionInstructionProgramCounterEffectFlow:
         assert all(function_offset % 2 == 0 for function_offset in self.function_offsets if function_offset is not None)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FunctionInstructionProgramCounterEffectCall:
     addresses: Set[Address]  # different options to call
     return_function_offset: Address | None  # None means that a return will flow outside program space
@@ -38,7 +38,7 @@ class FunctionInstructionProgramCounterEffectCall:
         assert self.return_function_offset is None or self.return_function_offset % 2 == 0
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FunctionInstructionProgramCounterEffectReturn:
     pass
 
@@ -50,7 +50,7 @@ type FunctionInstructionProgramCounterEffect = (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FunctionInstruction:
     function_offset: Address
     instruction: Instruction
@@ -70,7 +70,16 @@ class FunctionInstruction:
 class FunctionInstructions:
     inner: Collection[FunctionInstruction]
 
+    # flow targets are checked against it below, and s05 walks the graph through it
+    by_function_offset: Mapping[Address, FunctionInstruction] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "by_function_offset",
+            {instruction.function_offset: instruction for instruction in self.inner},
+        )
+
         # must contain at least one instruction
         assert self.inner
 
@@ -98,10 +107,6 @@ class FunctionInstructions:
             if function_offset is not None
         } <= self.by_function_offset.keys()
 
-    @cached_property
-    def by_function_offset(self) -> Mapping[Address, FunctionInstruction]:
-        return {instruction.function_offset: instruction for instruction in self.inner}
-
 
 @dataclass(frozen=True, kw_only=True)
 class Function:
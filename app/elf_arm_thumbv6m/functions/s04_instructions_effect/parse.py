@@ -1,4 +1,5 @@
 from collections.abc import Collection, Sequence, Set
+from functools import lru_cache
 
 from typing_extensions import Self
 
@@ -21,17 +22,17 @@ from .model import (
 
 def parse(parent_functions: parent.Functions, config: Config) -> Functions:
     functions = list[Function]()
-    exceptions = list[ParseFunctionInstructionsException]()
+    exceptions: list[ParseFunctionInstructionsException] | None = None  # created on first exception
 
     for parent_function in parent_functions.inner:
         try:
-            function = parse_function(parent_function, config)
+            functions.append(parse_function(parent_function, config))
         except ParseFunctionInstructionsException as exception:
+            if exceptions is None:
+                exceptions = list[ParseFunctionInstructionsException]()
             exceptions.append(exception)
-        else:
-            functions.append(function)
 
-    if exceptions:
+    if exceptions is not None:
         raise ExceptionGroup("Exceptions encountered while parsing functions", exceptions)
 
     # perform extra validations
@@ -48,23 +49,27 @@ def validate_functions(functions: Collection[Function]) -> None:
     function_calls_missing = set[tuple[Address, Address]]()  # {(call instruction address, callee address)}
     function_calls_invalid_return = set[tuple[Address, Address]]()  # {(call instruction address, callee address)}
     for function in functions:
+        function_address = function.address
+
         for instruction in function.instructions.inner:
-            if type(instruction.program_counter_effect) is not FunctionInstructionProgramCounterEffectCall:
+            program_counter_effect = instruction.program_counter_effect
+            if type(program_counter_effect) is not FunctionInstructionProgramCounterEffectCall:
                 continue
 
-            for call_address in instruction.program_counter_effect.addresses:
+            call_instruction_address = function_address + instruction.function_offset
+            return_function_offset_missing = program_counter_effect.return_function_offset is None
+
+            for call_address in program_counter_effect.addresses:
                 call_function = functions_by_address.get(call_address)
 
                 # mark missing calls
                 if call_function is None:
-                    function_calls_missing.add((function.address + instruction.function_offset, call_address))
+                    function_calls_missing.add((call_instruction_address, call_address))
                     continue
 
                 # mark if function returns, but we cant handle it
-                if instruction.program_counter_effect.return_function_offset is None and call_function.returns:
-                    function_calls_invalid_return.add(
-                        (function.address + instruction.function_offset, call_function.address)
-                    )
+                if return_function_offset_missing and call_function.returns:
+                    function_calls_invalid_return.add((call_instruction_address, call_function.address))
                     continue
 
     if function_calls_missing:
@@ -131,13 +136,14 @@ def parse_function_instructions(cursor_function: CursorFunction, config: Config)
         if type(parent_function_region) is not parent.FunctionRegionInstructions:
             continue
 
-        for parent_function_region_instructions_index in range(len(parent_function_region.instructions)):
-            cursor_function_region_instructions = CursorFunctionRegionInstructions(
-                cursor_function=cursor_function,
-                function_regions_index=parent_function_regions_index,
-                function_region_instructions_index=parent_function_region_instructions_index,
-            )
-
+        # walk the region by following `next()` of the previous cursor. this reuses the cursor already created (and
+        # cached) while resolving flow target of the previous instruction, instead of creating a new one each time
+        cursor_function_region_instructions: CursorFunctionRegionInstructions | None = CursorFunctionRegionInstructions(
+            cursor_function=cursor_function,
+            function_regions_index=parent_function_regions_index,
+            function_region_instructions_index=0,
+        )
+        while cursor_function_region_instructions is not None:
             try:
                 instruction_ = parse_function_instruction(cursor_function_region_instructions, config)
             except (_program_counter_effect.ResolveException, _stack_pointer_effect.ResolveException) as exception:
@@ -145,6 +151,8 @@ def parse_function_instructions(cursor_function: CursorFunction, config: Config)
             else:
                 instructions.append(instruction_)
 
+            cursor_function_region_instructions = cursor_function_region_instructions.next()
+
     if exceptions:
         raise ParseFunctionInstructionsException(
             cursor_function.function, exceptions  # pyright: ignore[reportArgumentType]
@@ -187,6 +195,17 @@ def validate_function_instructions(instructions: Collection[FunctionInstruction]
         )
 
 
+@lru_cache(maxsize=8192)
+def function_instruction_program_counter_effect_call(
+    addresses: frozenset[Address], return_function_offset: Address | None
+) -> FunctionInstructionProgramCounterEffectCall:
+    # effects are immutable, so identical call effects (eg. repeated calls to the same veneer) can share an instance
+    return FunctionInstructionProgramCounterEffectCall(
+        addresses=addresses,
+        return_function_offset=return_function_offset,
+    )
+
+
 def parse_function_instruction(
     cursor_function_region_instructions: CursorFunctionRegionInstructions, config: Config
 ) -> FunctionInstruction:
@@ -221,10 +240,9 @@ def parse_function_instruction(
                 function_offsets=function_offsets,
             )
         case _program_counter_effect.EffectCall():
-            addresses = set(program_counter_effect_.target_addresses)
-            program_counter_effect = FunctionInstructionProgramCounterEffectCall(
-                addresses=addresses,
-                return_function_offset=flow_function_offset,
+            program_counter_effect = function_instruction_program_counter_effect_call(
+                program_counter_effect_.target_addresses,
+                flow_function_offset,
             )
         case _program_counter_effect.EffectReturn():
             program_counter_effect = FunctionInstructionProgramCounterEffectReturn()
@@ -1,5 +1,5 @@
-from collections.abc import Collection, Mapping, Set
-from dataclasses import dataclass
+from collections.abc import Collection, Mapping, Sequence, Set
+from dataclasses import dataclass, field
 from functools import cached_property
 from itertools import pairwise
 
@@ -9,7 +9,7 @@ from ...common import Address
 from ...instructions_decoder.model import Instruction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FunctionInstruction:
     function_offset: Address
     instruction: Instruction
@@ -41,7 +41,16 @@ class FunctionInstruction:
 class FunctionInstructions:
     inner: Collection[FunctionInstruction]
 
+    # needed below for next instructions check, then by s06 for graph traversal
+    by_function_offset: Mapping[Address, FunctionInstruction] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "by_function_offset",
+            {instruction.function_offset: instruction for instruction in self.inner},
+        )
+
         # must contain at least one instruction
         assert self.inner
 
@@ -69,8 +78,31 @@ class FunctionInstructions:
         } <= self.by_function_offset.keys()
 
     @cached_property
-    def by_function_offset(self) -> Mapping[Address, FunctionInstruction]:
-        return {instruction.function_offset: instruction for instruction in self.inner}
+    def _function_offsets_stack_grow_return(self) -> tuple[frozenset[Address], Sequence[Address]]:
+        # single pass for both stack affecting and returning instructions, as both are needed together
+
+        function_offsets_stack_grow = list[Address]()
+        function_offsets_return = list[Address]()
+
+        for instruction in self.inner:
+            if instruction.stack_grow != 0:
+                function_offsets_stack_grow.append(instruction.function_offset)
+            if instruction.function_offsets_next is None:
+                function_offsets_return.append(instruction.function_offset)
+
+        return frozenset(function_offsets_stack_grow), tuple(function_offsets_return)
+
+    @cached_property
+    def function_offsets_stack_grow(self) -> frozenset[Address]:
+        # offsets of all instructions affecting the stack
+
+        return self._function_offsets_stack_grow_return[0]
+
+    @cached_property
+    def function_offsets_return(self) -> Sequence[Address]:
+        # offsets of all returning instructions, ordered
+
+        return self._function_offsets_stack_grow_return[1]
 
     @cached_property
     def function_offsets_next(self) -> Mapping[Address, Set[Address]]:
@@ -83,16 +115,42 @@ class FunctionInstructions:
         }
 
     @cached_property
-    def function_offsets_previous(self) -> Mapping[Address, Set[Address]]:
+    def function_offsets_previous(self) -> Mapping[Address, Sequence[Address]]:
         # will not contain functions with no previous
+        # most instructions have one or two predecessors, so they are kept as (unique, as next are sets) tuples instead
+        # of sets
 
-        function_offsets_previous = dict[Address, set[Address]]()
+        function_offsets_previous = dict[Address, list[Address]]()
 
         for function_offset, function_offsets_next in self.function_offsets_next.items():
             for function_offset_next in function_offsets_next:
-                function_offsets_previous.setdefault(function_offset_next, set()).add(function_offset)
+                function_offsets_previous.setdefault(function_offset_next, []).append(function_offset)
 
-        return function_offsets_previous
+        return {
+            function_offset: tuple(function_offsets_previous_)
+            for function_offset, function_offsets_previous_ in function_offsets_previous.items()
+        }
+
+    @cached_property
+    def function_offset_next_single(self) -> Mapping[Address, Address]:
+        # only instructions with exactly one next, flattened for straight-line walks
+
+        return {
+            function_offset: function_offset_next
+            for function_offset, function_offsets_next in self.function_offsets_next.items()
+            if len(function_offsets_next) == 1
+            for function_offset_next in function_offsets_next
+        }
+
+    @cached_property
+    def function_offset_previous_single(self) -> Mapping[Address, Address]:
+        # only instructions with exactly one previous, flattened for straight-line walks
+
+        return {
+            function_offset: function_offsets_previous[0]
+            for function_offset, function_offsets_previous in self.function_offsets_previous.items()
+            if len(function_offsets_previous) == 1
+        }
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -127,7 +185,7 @@ class Function:
 
     @cached_property
     def returns(self) -> bool:
-        return any(instruction.function_offsets_next is None for instruction in self.instructions.inner)
+        return bool(self.instructions.function_offsets_return)
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,3 @@
-from collections.abc import Set
-
 from ...common import Address
 from ..s05_instructions_graph import model as parent
 from .model import Function, Functions
@@ -23,16 +21,18 @@ def parse_function(parent_function: parent.Function) -> Function:
 
 
 def resolve_function_stack_grow(parent_function: parent.Function) -> int:
-    # get function offsets of all instructions affecting the stack
-    # we will later check if our entry -> + <- return searches found all of them
-    function_offsets_stack_grow_all = {
-        instruction.function_offset for instruction in parent_function.instructions.inner if instruction.stack_grow != 0
-    }
-    function_offsets_traversed = set[Address]()
+    # function not affecting the stack at all (eg. simple leaf function) - all walks would resolve to zero
+    if not parent_function.instructions.function_offsets_stack_grow:
+        return 0
+
+    # count instructions affecting the stack reached by entry -> + <- return searches, we will later check if they found
+    # all of them. entry side only visits growing and return side only shrinking ones, while return paths are disjoint,
+    # so no instruction is counted twice
+    stack_grow_count_traversed = 0
 
     # entry
-    stack_grow_entry, function_offsets_entry = resolve_function_stack_grow_function_offsets_entry(parent_function)
-    function_offsets_traversed.update(function_offsets_entry)
+    stack_grow_entry, stack_grow_count_entry = resolve_function_stack_grow_function_offsets_entry(parent_function)
+    stack_grow_count_traversed += stack_grow_count_entry
 
     # returns (multiple)
     stack_grow_function_offsets_returns = resolve_function_stack_grow_function_offsets_returns(parent_function)
@@ -41,8 +41,8 @@ def resolve_function_stack_grow(parent_function: parent.Function) -> int:
     assert (stack_grow_function_offsets_returns is None) == (not parent_function.returns)
 
     if stack_grow_function_offsets_returns is not None:
-        stack_grow_return, function_offsets_returns = stack_grow_function_offsets_returns
-        function_offsets_traversed.update(function_offsets_returns)
+        stack_grow_return, stack_grow_count_returns = stack_grow_function_offsets_returns
+        stack_grow_count_traversed += stack_grow_count_returns
 
         if stack_grow_entry != -stack_grow_return:
             raise ValueError(
@@ -51,7 +51,7 @@ def resolve_function_stack_grow(parent_function: parent.Function) -> int:
             )
 
     # check if we found all stack affecting instructions
-    if not function_offsets_traversed >= function_offsets_stack_grow_all:
+    if stack_grow_count_traversed != len(parent_function.instructions.function_offsets_stack_grow):
         raise ValueError(
             "Unable to reach all instructions affecting stack using entry-return method. "
             "This usually means that function isn't easily analyzable, "
@@ -65,120 +65,85 @@ def resolve_function_stack_grow(parent_function: parent.Function) -> int:
     return stack_grow_entry
 
 
-def resolve_function_stack_grow_function_offsets_entry(parent_function: parent.Function) -> tuple[int, Set[Address]]:
+def resolve_function_stack_grow_function_offsets_entry(parent_function: parent.Function) -> tuple[int, int]:
     # from entry point
 
+    # local names for lookups used on every step
+    instructions_by_function_offset = parent_function.instructions.by_function_offset
+    instructions_function_offsets_previous = parent_function.instructions.function_offsets_previous
+    instructions_function_offset_next_single = parent_function.instructions.function_offset_next_single
+
     stack_grow = 0
-    function_offsets = set[Address]()
+    stack_grow_count = 0  # number of instructions affecting the stack
+    function_offsets_visited = bytearray(function_offsets_visited_size(parent_function))  # by function_offset // 2
 
     function_offset = 0  # start with function entry
     while True:
         # make sure that we are not in a cycle
-        function_offsets_previous = parent_function.instructions.function_offsets_previous.get(function_offset, set())
+        function_offsets_previous = instructions_function_offsets_previous.get(function_offset)
         if function_offset == 0:
             # first instruction may not have any incoming edge
-            if len(function_offsets_previous) != 0:
+            if function_offsets_previous is not None:
                 break
         else:
             # non-first instructions may only have one incoming edge
-            if len(function_offsets_previous) != 1:
+            if function_offsets_previous is None or len(function_offsets_previous) != 1:
                 break
 
-        function_instruction = parent_function.instructions.by_function_offset[function_offset]
+        function_instruction = instructions_by_function_offset[function_offset]
 
         # stop iterating if function makes a call
         if function_instruction.call_addresses:
             break
 
         # stop iterating if function shrinks the stack (may happen only on return side)
-        if function_instruction.stack_grow < 0:
+        function_instruction_stack_grow = function_instruction.stack_grow
+        if function_instruction_stack_grow < 0:
             break
 
         # mark stack grow
-        stack_grow += function_instruction.stack_grow
+        if function_instruction_stack_grow != 0:
+            stack_grow += function_instruction_stack_grow
+            stack_grow_count += 1
 
         # add this function to visited. since we stop at branches, we shouldn't be able to reach the same address
-        assert function_offset not in function_offsets
-        function_offsets.add(function_offset)
+        assert not function_offsets_visited[function_offset // 2]
+        function_offsets_visited[function_offset // 2] = 1
 
         # go to next node if there is exactly one, otherwise stop iterating
-        match list(parent_function.instructions.function_offsets_next.get(function_offset, set())):
-            case [function_offset_next]:
-                pass
-            case _:
-                break
+        function_offset_next = instructions_function_offset_next_single.get(function_offset)
+        if function_offset_next is None:
+            break
 
         function_offset = function_offset_next
 
-    return stack_grow, function_offsets
+    return stack_grow, stack_grow_count
 
 
-def resolve_function_stack_grow_function_offsets_returns(
-    parent_function: parent.Function,
-) -> tuple[int, Set[Address]] | None:
+def resolve_function_stack_grow_function_offsets_returns(parent_function: parent.Function) -> tuple[int, int] | None:
     # there could be multiple return points from this function
     # they should make exactly same effect (with different nodes involved)
-    def resolve_function_stack_grow_function_offsets_return(
-        function_offset_return: Address,
-    ) -> tuple[int, Set[Address]]:
-        stack_grow = 0
-        function_offsets = set[Address]()
-
-        function_offset = function_offset_return
-        while True:
-            function_offsets_next = parent_function.instructions.function_offsets_next.get(function_offset, set())
-            if function_offset == function_offset_return:
-                # last instruction may not have any outgoing edges
-                if len(function_offsets_next) != 0:
-                    break
-            else:
-                # non-last instruction may have only one outgoing edge
-                if len(function_offsets_next) != 1:
-                    break
-
-            function_instruction = parent_function.instructions.by_function_offset[function_offset]
-
-            # stop iterating if function makes a call
-            if function_instruction.call_addresses:
-                break
-
-            # stop iterating if function grows the stack (may happen only on entry side)
-            if function_instruction.stack_grow > 0:
-                break
-
-            # mark stack grow
-            stack_grow += function_instruction.stack_grow
-
-            # add this function to visited. since we stop at branches, we shouldn't be able to reach the same address
-            assert function_offset not in function_offsets
-            function_offsets.add(function_offset)
 
-            # go back to previous node if there is exactly one, otherwise stop iterating
-            match list(parent_function.instructions.function_offsets_previous.get(function_offset, set())):
-                case [function_offset_previous]:
-                    pass
-                case _:
-                    break
-
-            function_offset = function_offset_previous
+    function_offsets_return = parent_function.instructions.function_offsets_return
+    if not function_offsets_return:
+        # function has no return, so we don't care about the stack size
+        return None
 
-        return stack_grow, function_offsets
+    # visited instructions, shared by all return paths, by function_offset // 2
+    function_offsets_visited = bytearray(function_offsets_visited_size(parent_function))
 
     # resolve stack grow starting from each return instruction
-    function_offsets_return_stack_grow_function_offsets = {  # {return function offset: (stack grow, function offsets)}
-        function_instruction.function_offset: resolve_function_stack_grow_function_offsets_return(
-            function_instruction.function_offset
+    stack_grows_return = list[int]()
+    stack_grow_count = 0  # stack affecting instructions of all paths
+    for function_offset_return in function_offsets_return:
+        stack_grow_return, stack_grow_count_return = resolve_function_stack_grow_function_offsets_return(
+            parent_function, function_offsets_visited, function_offset_return
         )
-        for function_instruction in parent_function.instructions.inner
-        if function_instruction.function_offsets_next is None  # only returning instructions
-    }
-
-    if not function_offsets_return_stack_grow_function_offsets:
-        # function has no return, so we don't care about the stack size
-        return None
+        stack_grows_return.append(stack_grow_return)
+        stack_grow_count += stack_grow_count_return
 
     # all return paths should have the same stack grow size
-    stack_grows = list({stack_grow for stack_grow, _ in function_offsets_return_stack_grow_function_offsets.values()})
+    stack_grows = sorted(set(stack_grows_return))
     match stack_grows:
         case [stack_grow]:
             pass
@@ -187,17 +152,72 @@ def resolve_function_stack_grow_function_offsets_returns(
             # there must be multiple paths with differing stack grow
             raise ValueError(
                 "Different return paths results in differing stack sizes: "
-                f"({", ".join(str(stack_grow for stack_grow in stack_grows))})."
+                f"({", ".join(str(stack_grow) for stack_grow in stack_grows)})."
             )
 
-    # resolve all involved function_offsets
-    function_offsets = set[Address]()
-    for _, function_offsets_ in function_offsets_return_stack_grow_function_offsets.values():
-        # paths may not have common nodes
-        # this is guaranteed by iteration stop on first node with two sources
-        assert function_offsets_.isdisjoint(function_offsets)
+    return stack_grow, stack_grow_count
+
+
+def resolve_function_stack_grow_function_offsets_return(
+    parent_function: parent.Function,
+    function_offsets_visited: bytearray,
+    function_offset_return: Address,
+) -> tuple[int, int]:
+    # from a single return instruction, walking backwards
+    # function_offsets_visited is shared by all return paths of the function
+
+    # local names for lookups used on every step
+    instructions_by_function_offset = parent_function.instructions.by_function_offset
+    instructions_function_offsets_next = parent_function.instructions.function_offsets_next
+    instructions_function_offset_previous_single = parent_function.instructions.function_offset_previous_single
+
+    stack_grow = 0
+    stack_grow_count = 0  # number of instructions affecting the stack
+
+    function_offset = function_offset_return
+    while True:
+        function_offsets_next = instructions_function_offsets_next.get(function_offset)
+        if function_offset == function_offset_return:
+            # last instruction may not have any outgoing edges
+            if function_offsets_next is not None:
+                break
+        else:
+            # non-last instruction may have only one outgoing edge
+            if function_offsets_next is None or len(function_offsets_next) != 1:
+                break
+
+        function_instruction = instructions_by_function_offset[function_offset]
+
+        # stop iterating if function makes a call
+        if function_instruction.call_addresses:
+            break
+
+        # stop iterating if function grows the stack (may happen only on entry side)
+        function_instruction_stack_grow = function_instruction.stack_grow
+        if function_instruction_stack_grow > 0:
+            break
+
+        # mark stack grow
+        if function_instruction_stack_grow != 0:
+            stack_grow += function_instruction_stack_grow
+            stack_grow_count += 1
+
+        # add this function to visited. since we stop at branches, we shouldn't be able to reach the same address
+        # paths may not have common nodes either, this is guaranteed by iteration stop on first node with two
+        # sources
+        assert not function_offsets_visited[function_offset // 2]
+        function_offsets_visited[function_offset // 2] = 1
+
+        # go back to previous node if there is exactly one, otherwise stop iterating
+        function_offset_previous = instructions_function_offset_previous_single.get(function_offset)
+        if function_offset_previous is None:
+            break
+
+        function_offset = function_offset_previous
+
+    return stack_grow, stack_grow_count
 
-        # add to the combined set
-        function_offsets.update(function_offsets_)
 
-    return stack_grow, function_offsets
+def function_offsets_visited_size(parent_function: parent.Function) -> int:
+    # instructions are halfword aligned, so each halfword of function may hold at most one instruction
+    return (parent_function.size + 1) // 2
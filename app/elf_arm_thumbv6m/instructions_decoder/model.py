@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Set
+from collections.abc import Iterable, Mapping, Set
 from dataclasses import dataclass
 from enum import IntEnum
 from itertools import chain
-from typing import Self
+from typing import ClassVar
 
 
 class InstructionUndefined(Exception):
@@ -48,20 +48,17 @@ class Register4(IntEnum):
     LR = 14
     PC = 15
 
-    @classmethod
-    def from_register3(cls, register3: Register3) -> Self:
-        return cls(register3.value)
-
-    def to_register3(self) -> Register3 | None:
-        if self.value >= 8:
-            return None
-
-        return Register3(self.value)
-
     def __str__(self) -> str:
         return self.name
 
 
+# register conversions, indexed by register value
+REGISTER4_BY_REGISTER3: tuple[Register4, ...] = tuple(Register4(register3.value) for register3 in Register3)
+REGISTER3_BY_REGISTER4: tuple[Register3 | None, ...] = tuple(
+    Register3(register4.value) if register4.value < 8 else None for register4 in Register4
+)
+
+
 class Condition(IntEnum):
     EQ = 0
     NE = 1
@@ -100,7 +97,56 @@ class SysM(IntEnum):
         return self.name
 
 
-@dataclass(frozen=True)
+# shared affects_registers() results, indexed by register value (Register3 values match low Register4 values)
+AFFECTS_REGISTERS_NONE: Set[Register4] = frozenset()
+AFFECTS_REGISTERS_SINGLE: tuple[Set[Register4], ...] = tuple(frozenset([register4]) for register4 in Register4)
+AFFECTS_REGISTERS_LR_PC: Set[Register4] = frozenset([Register4.LR, Register4.PC])
+
+# every LDM/STM/PUSH/POP register list, indexed by its 8-bit register mask
+REGISTERS3_BY_MASK: tuple[Set[Register3], ...] = tuple(
+    frozenset(register3 for register3 in Register3 if mask & (1 << register3.value)) for mask in range(1 << 8)
+)
+
+
+def affects_registers_pop(pc: bool, registers3: Iterable[Register3]) -> Set[Register4]:
+    return frozenset(
+        chain(
+            [Register4.PC] if pc else [],
+            (REGISTER4_BY_REGISTER3[register3] for register3 in registers3),
+            [Register4.SP],
+        )
+    )
+
+
+# POP results, indexed by pc flag and then by register list interned in REGISTERS3_BY_MASK
+AFFECTS_REGISTERS_POP: tuple[Mapping[Set[Register3], Set[Register4]], ...] = tuple(
+    {registers3: affects_registers_pop(pc, registers3) for registers3 in REGISTERS3_BY_MASK} for pc in (False, True)
+)
+
+
+# affects_registers() for instructions that always affect the same registers
+class AffectsRegistersNone:
+    __slots__ = ()
+
+    def affects_registers(self) -> Set[Register4]:
+        return AFFECTS_REGISTERS_NONE
+
+
+class AffectsRegistersSp:
+    __slots__ = ()
+
+    def affects_registers(self) -> Set[Register4]:
+        return AFFECTS_REGISTERS_SINGLE[Register4.SP]
+
+
+class AffectsRegistersPc:
+    __slots__ = ()
+
+    def affects_registers(self) -> Set[Register4]:
+        return AFFECTS_REGISTERS_SINGLE[Register4.PC]
+
+
+@dataclass(frozen=True, slots=True)
 class Instruction(ABC):
     @classmethod
     @abstractmethod
@@ -116,14 +162,14 @@ class Instruction(ABC):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Instruction16(Instruction, ABC):
     @classmethod
     def size(cls) -> int:
         return 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Instruction32(Instruction, ABC):
     @classmethod
     def size(cls) -> int:
@@ -131,135 +177,121 @@ class Instruction32(Instruction, ABC):
 
 
 # common shared bases
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionD3Imm(Instruction16):
     d: Register3
     imm: int
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionDn3Imm(Instruction16):
     dn: Register3
     imm: int
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.dn)}
+        return AFFECTS_REGISTERS_SINGLE[self.dn]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionD3M3(Instruction16):
     d: Register3
     m: Register3
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionDn3M3(Instruction16):
     dn: Register3
     m: Register3
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.dn)}
+        return AFFECTS_REGISTERS_SINGLE[self.dn]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionD3N3M3(Instruction16):
     d: Register3
     n: Register3
     m: Register3
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionD3N3Imm(Instruction16):
     d: Register3
     n: Register3
     imm: int
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionD3M3Imm(Instruction16):
     d: Register3
     m: Register3
     imm: int
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
-class BaseInstructionN3M3(Instruction16):
+@dataclass(frozen=True, slots=True)
+class BaseInstructionN3M3(AffectsRegistersNone, Instruction16):
     n: Register3
     m: Register3
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
 # concrete shared bases
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionLdrImmediate(Instruction16):
     t: Register3
     n: Register3
-    imm: int  # NOTE: multiplied by 1/2/4 depending on load_size
+    imm: int  # NOTE: already multiplied by 1/2/4 depending on load_size
 
-    @classmethod
-    @abstractmethod
-    def load_size(cls) -> int:
-        pass
+    load_size: ClassVar[int]
+    suffix: ClassVar[str]  # resolved once per concrete class from load_size
 
-    def __str__(self) -> str:
-        load_size = self.load_size()
-        match load_size:
+    def __init_subclass__(cls) -> None:
+        match cls.load_size:
             case 1:
-                suffix = "B"
+                cls.suffix = "B"
             case 2:
-                suffix = "H"
+                cls.suffix = "H"
             case 4:
-                suffix = ""
+                cls.suffix = ""
             case _:
                 assert False
 
-        return f"LDR{suffix} {self.t}, [{self.n}{f', #0x{(self.imm * load_size):0X}' if self.imm else ''}]"
+    def __str__(self) -> str:
+        return f"LDR{self.suffix} {self.t}, [{self.n}{f', #0x{self.imm:0X}' if self.imm else ''}]"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.t)}
+        return AFFECTS_REGISTERS_SINGLE[self.t]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseInstructionLdrRegister(Instruction16):
     t: Register3
     n: Register3
     m: Register3
 
-    @classmethod
-    @abstractmethod
-    def signed(cls) -> bool:
-        pass
-
-    @classmethod
-    @abstractmethod
-    def load_size(cls) -> int:
-        pass
-
-    def __str__(self) -> str:
-        signed = self.signed()
-        load_size = self.load_size()
+    signed: ClassVar[bool]
+    load_size: ClassVar[int]
+    suffix: ClassVar[str]  # resolved once per concrete class from signed and load_size
 
+    def __init_subclass__(cls) -> None:
         suffix = ""
-        if signed:
+        if cls.signed:
             suffix += "S"
-        match load_size:
+        match cls.load_size:
             case 1:
                 suffix += "B"
             case 2:
@@ -268,73 +300,65 @@ class BaseInstructionLdrRegister(Instruction16):
                 pass
             case _:
                 assert False
+        cls.suffix = suffix
 
-        return f"LDR{suffix} {self.t}, [{self.n}, {self.m}]"
+    def __str__(self) -> str:
+        return f"LDR{self.suffix} {self.t}, [{self.n}, {self.m}]"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.t)}
+        return AFFECTS_REGISTERS_SINGLE[self.t]
 
 
-@dataclass(frozen=True)
-class BaseInstructionStrImmediate(Instruction16):
+@dataclass(frozen=True, slots=True)
+class BaseInstructionStrImmediate(AffectsRegistersNone, Instruction16):
     t: Register3
     n: Register3
-    imm: int  # NOTE: multiplied by 1/2/4 depending on store_size
+    imm: int  # NOTE: already multiplied by 1/2/4 depending on store_size
 
-    @classmethod
-    @abstractmethod
-    def store_size(cls) -> int:
-        pass
+    store_size: ClassVar[int]
+    suffix: ClassVar[str]  # resolved once per concrete class from store_size
 
-    def __str__(self) -> str:
-        store_size = self.store_size()
-        match store_size:
+    def __init_subclass__(cls) -> None:
+        match cls.store_size:
             case 1:
-                suffix = "B"
+                cls.suffix = "B"
             case 2:
-                suffix = "H"
+                cls.suffix = "H"
             case 4:
-                suffix = ""
+                cls.suffix = ""
             case _:
                 assert False
 
-        return f"STR{suffix} {self.t}, [{self.n}{f', #0x{(self.imm * store_size):0X}' if self.imm else ''}]"
-
-    def affects_registers(self) -> Set[Register4]:
-        return set()
+    def __str__(self) -> str:
+        return f"STR{self.suffix} {self.t}, [{self.n}{f', #0x{self.imm:0X}' if self.imm else ''}]"
 
 
-@dataclass(frozen=True)
-class BaseInstructionStrRegister(Instruction16):
+@dataclass(frozen=True, slots=True)
+class BaseInstructionStrRegister(AffectsRegistersNone, Instruction16):
     t: Register3
     n: Register3
     m: Register3
 
-    @classmethod
-    @abstractmethod
-    def store_size(cls) -> int:
-        pass
+    store_size: ClassVar[int]
+    suffix: ClassVar[str]  # resolved once per concrete class from store_size
 
-    def __str__(self) -> str:
-        store_size = self.store_size()
-        match store_size:
+    def __init_subclass__(cls) -> None:
+        match cls.store_size:
             case 1:
-                suffix = "B"
+                cls.suffix = "B"
             case 2:
-                suffix = "H"
+                cls.suffix = "H"
             case 4:
-                suffix = ""
+                cls.suffix = ""
             case _:
                 assert False
 
-        return f"STR{suffix} {self.t}, [{self.n}, {self.m}]"
-
-    def affects_registers(self) -> Set[Register4]:
-        return set()
+    def __str__(self) -> str:
+        return f"STR{self.suffix} {self.t}, [{self.n}, {self.m}]"
 
 
 # concrete instructions
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAdcRegisterT1(BaseInstructionDn3M3):
     # A6.7.1 ADC (register) T1
 
@@ -342,7 +366,7 @@ class InstructionAdcRegisterT1(BaseInstructionDn3M3):
         return f"ADCS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddImmediateT1(BaseInstructionD3N3Imm):
     # A6.7.2 ADD (immediate) T1
 
@@ -350,7 +374,7 @@ class InstructionAddImmediateT1(BaseInstructionD3N3Imm):
         return f"ADDS {self.d}, {self.n}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddImmediateT2(BaseInstructionDn3Imm):
     # A6.7.2 ADD (immediate) T2
 
@@ -358,7 +382,7 @@ class InstructionAddImmediateT2(BaseInstructionDn3Imm):
         return f"ADDS {self.dn}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddRegisterT1(BaseInstructionD3N3M3):
     # A6.7.3 ADD (register) T1
 
@@ -366,49 +390,48 @@ class InstructionAddRegisterT1(BaseInstructionD3N3M3):
         return f"ADDS {self.d}, {self.n}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddRegisterT2(Instruction16):
     # A6.7.3 ADD (register) T2
     dn: Register4  # d == n, not SP
     m: Register4  # not SP
 
-    def __post_init__(self) -> None:
-        # these are handled as InstructionAddSpPlusRegisterT1/2
-        assert self.dn is not Register4.SP
-        assert self.m is not Register4.SP
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            # these are handled as InstructionAddSpPlusRegisterT1/2
+            assert self.dn is not Register4.SP
+            assert self.m is not Register4.SP
 
-        # this is Unpredictable
-        assert not (self.dn is Register4.PC and self.m is Register4.PC)
+            # this is Unpredictable
+            assert not (self.dn is Register4.PC and self.m is Register4.PC)
 
     def __str__(self) -> str:
         return f"ADD {self.dn}, {self.m}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {self.dn}
+        return AFFECTS_REGISTERS_SINGLE[self.dn]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddSpPlusImmediateT1(BaseInstructionD3Imm):
     # A6.7.4 ADD (SP plus immediate) T1
-    # NOTE: imm multiplied by 4
+    # NOTE: imm already multiplied by 4
 
     def __str__(self) -> str:
-        return f"ADD {self.d}, SP, #0x{(self.imm * 4):0X}"
+        return f"ADD {self.d}, SP, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
-class InstructionAddSpPlusImmediateT2(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionAddSpPlusImmediateT2(AffectsRegistersSp, Instruction16):
     # A6.7.4 ADD (SP plus immediate) T2
-    imm: int  # NOTE: multiplied by 4
+    imm: int  # NOTE: already multiplied by 4
 
     def __str__(self) -> str:
-        return f"ADD SP, SP, #0x{(self.imm * 4):0X}"
+        return f"ADD SP, SP, #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.SP}
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAddSpPlusRegisterT1(Instruction16):
     # A6.7.5 ADD (SP plus register) T1
     dm: Register4
@@ -417,35 +440,34 @@ class InstructionAddSpPlusRegisterT1(Instruction16):
         return f"ADD {self.dm}, SP, {self.dm}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {self.dm}
+        return AFFECTS_REGISTERS_SINGLE[self.dm]
 
 
-@dataclass(frozen=True)
-class InstructionAddSpPlusRegisterT2(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionAddSpPlusRegisterT2(AffectsRegistersSp, Instruction16):
     # A6.7.5 ADD (SP plus register) T2
     m: Register4
 
-    def __post_init__(self) -> None:
-        assert self.m is not Register4.SP  # encoding T1
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.m is not Register4.SP  # encoding T1
 
     def __str__(self) -> str:
         return f"ADD SP, {self.m}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.SP}
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAdrT1(BaseInstructionD3Imm):
     # A6.7.6 ADR T1
     # TODO: add register/immediate/literal?
-    # NOTE: imm multiplied by 4
+    # NOTE: imm already multiplied by 4
 
     def __str__(self) -> str:
-        return f"ADR {self.d}, PC + #0x{(self.imm * 4):0X}]"
+        return f"ADR {self.d}, PC + #0x{self.imm:0X}]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAndRegisterT1(BaseInstructionDn3M3):
     # A6.7.7 AND (register) T1
 
@@ -453,7 +475,7 @@ class InstructionAndRegisterT1(BaseInstructionDn3M3):
         return f"ANDS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAsrImmediateT1(BaseInstructionD3M3Imm):
     # A6.7.8 ASR (immediate) T1
 
@@ -461,7 +483,7 @@ class InstructionAsrImmediateT1(BaseInstructionD3M3Imm):
         return f"ASRS {self.d}, {self.m}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionAsrRegisterT1(BaseInstructionDn3M3):
     # A6.7.9 ASR (register) T1
 
@@ -469,37 +491,33 @@ class InstructionAsrRegisterT1(BaseInstructionDn3M3):
         return f"ASRS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionBT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionBT1(AffectsRegistersPc, Instruction16):
     # A6.7.10 B T1
     # TODO: add register/immediate/literal?
     cond: Condition
-    imm: int  # NOTE: multiplied by 2
+    imm: int  # NOTE: already multiplied by 2
 
-    def __post_init__(self) -> None:
-        assert self.cond is not Condition.AL  # is UDF
+    if __debug__:
 
-    def __str__(self) -> str:
-        return f"B{self.cond} PC + 0x{(self.imm * 2):0X}"
+        def __post_init__(self) -> None:
+            assert self.cond is not Condition.AL  # is UDF
 
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.PC}
+    def __str__(self) -> str:
+        return f"B{self.cond} PC + 0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
-class InstructionBT2(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionBT2(AffectsRegistersPc, Instruction16):
     # A6.7.10 B T2
     # TODO: add register/immediate/literal?
-    imm: int  # NOTE: multiplied by 2
+    imm: int  # NOTE: already multiplied by 2
 
     def __str__(self) -> str:
-        return f"B PC + 0x{(self.imm * 2):0X}"
-
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.PC}
+        return f"B PC + 0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionBicRegisterT1(BaseInstructionDn3M3):
     # A6.7.11 BIC (register) T1
 
@@ -507,8 +525,8 @@ class InstructionBicRegisterT1(BaseInstructionDn3M3):
         return f"BICS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionBkptT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionBkptT1(AffectsRegistersNone, Instruction16):
     # A6.7.12 BKPT T1
     # TODO: add register/immediate/literal?
     imm: int
@@ -516,55 +534,53 @@ class InstructionBkptT1(Instruction16):
     def __str__(self) -> str:
         return f"BKPT #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionBlT1(Instruction32):
     # A6.7.13 BL T1
     # TODO: add register/immediate/literal?
-    imm: int  # NOTE: multiplied by 2
+    imm: int  # NOTE: already multiplied by 2
 
     def __str__(self) -> str:
-        return f"BL PC + 0x{(self.imm * 2):0X}"
+        return f"BL PC + 0x{self.imm:0X}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.LR, Register4.PC}
+        return AFFECTS_REGISTERS_LR_PC
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionBlxRegisterT1(Instruction16):
     # A6.7.14 BLX (register) T1
     m: Register4
 
-    def __post_init__(self) -> None:
-        assert self.m is not Register4.PC
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.m is not Register4.PC
 
     def __str__(self) -> str:
         return f"BLX {self.m}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.LR, Register4.PC}
+        return AFFECTS_REGISTERS_LR_PC
 
 
-@dataclass(frozen=True)
-class InstructionBxT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionBxT1(AffectsRegistersPc, Instruction16):
     # A6.7.15 BX T1
     # TODO: add register/immediate/literal?
     m: Register4
 
-    def __post_init__(self) -> None:
-        assert self.m is not Register4.PC
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.m is not Register4.PC
 
     def __str__(self) -> str:
         return f"BX {self.m}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.PC}
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionCmnRegisterT1(BaseInstructionN3M3):
     # A6.7.16 CMN (register) T1
 
@@ -572,8 +588,8 @@ class InstructionCmnRegisterT1(BaseInstructionN3M3):
         return f"CMN {self.n}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionCmpImmediateT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionCmpImmediateT1(AffectsRegistersNone, Instruction16):
     # A6.7.17 CMP (immediate) T1
     n: Register3
     imm: int
@@ -581,11 +597,8 @@ class InstructionCmpImmediateT1(Instruction16):
     def __str__(self) -> str:
         return f"CMP {self.n}, #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionCmpRegisterT1(BaseInstructionN3M3):
     # A6.7.18 CMP (register) T1
 
@@ -593,25 +606,24 @@ class InstructionCmpRegisterT1(BaseInstructionN3M3):
         return f"CMP {self.n}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionCmpRegisterT2(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionCmpRegisterT2(AffectsRegistersNone, Instruction16):
     # A6.7.18 CMP (register) T2
     n: Register4
     m: Register4
 
-    def __post_init__(self) -> None:
-        assert not (self.n.value < 8 and self.m.value < 8)
-        assert not (self.n is Register4.PC or self.m is Register4.PC)
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert not (self.n.value < 8 and self.m.value < 8)
+            assert not (self.n is Register4.PC or self.m is Register4.PC)
 
     def __str__(self) -> str:
         return f"CMP {self.n}, {self.m}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
-class InstructionDmbT1(Instruction32):
+@dataclass(frozen=True, slots=True)
+class InstructionDmbT1(AffectsRegistersNone, Instruction32):
     # A6.7.21 DMB T1
     # TODO: add register/immediate/literal?
     option: int
@@ -619,12 +631,9 @@ class InstructionDmbT1(Instruction32):
     def __str__(self) -> str:
         return f"DMB #0x{self.option:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
-class InstructionDsbT1(Instruction32):
+@dataclass(frozen=True, slots=True)
+class InstructionDsbT1(AffectsRegistersNone, Instruction32):
     # A6.7.22 DSB T1
     # TODO: add register/immediate/literal?
     option: int
@@ -632,11 +641,8 @@ class InstructionDsbT1(Instruction32):
     def __str__(self) -> str:
         return f"DSB #0x{self.option:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionEorRegisterT1(BaseInstructionDn3M3):
     # A6.7.23 EOR (register) T1
 
@@ -644,8 +650,8 @@ class InstructionEorRegisterT1(BaseInstructionDn3M3):
         return f"EORS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionIsbT1(Instruction32):
+@dataclass(frozen=True, slots=True)
+class InstructionIsbT1(AffectsRegistersNone, Instruction32):
     # A6.7.24 ISB T1
     # TODO: add register/immediate/literal?
     option: int
@@ -653,161 +659,136 @@ class InstructionIsbT1(Instruction32):
     def __str__(self) -> str:
         return f"ISB #0x{self.option:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdmT1(Instruction16):
     # A6.7.25 LDM, LDMIA, LDMFD T1
     # TODO: add register/immediate/literal?
     n: Register3
     registers: Set[Register3]
 
-    def __post_init__(self) -> None:
-        assert self.registers
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.registers
 
     def __str__(self) -> str:
         return f"LDM {self.n}{'!' if self.n not in self.registers else ''}, {{{''.join(
-            str(register3) for register3 in Register3 if register3 in self.registers
+            str(register3) for register3 in sorted(self.registers)
         )}}}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(register) for register in chain([self.n], self.registers)}
+        return {REGISTER4_BY_REGISTER3[register] for register in chain([self.n], self.registers)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrImmediateT1(BaseInstructionLdrImmediate):
     # A6.7.26 LDR (immediate) T1
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 4
+    load_size = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrImmediateT2(Instruction16):
     # A6.7.26 LDR (immediate) T2
     t: Register3
-    imm: int  # NOTE: multiplied by 4
+    imm: int  # NOTE: already multiplied by 4
 
     def __str__(self) -> str:
-        return f"LDR {self.t}, [SP{f', #0x{(self.imm * 4):0X}' if self.imm else ''}]"
+        return f"LDR {self.t}, [SP{f', #0x{self.imm:0X}' if self.imm else ''}]"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.t)}
+        return AFFECTS_REGISTERS_SINGLE[self.t]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrLiteralT1(Instruction16):
     # A6.7.27 LDR (literal) T1
     t: Register3
-    imm: int  # NOTE: multiplied by 4
+    imm: int  # NOTE: already multiplied by 4
 
     def __str__(self) -> str:
-        return f"LDR {self.t}, PC + 0x{(self.imm * 4):0X}"
+        return f"LDR {self.t}, PC + 0x{self.imm:0X}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.t)}
+        return AFFECTS_REGISTERS_SINGLE[self.t]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrRegisterT1(BaseInstructionLdrRegister):
     # A6.7.28 LDR (register) T1
 
-    @classmethod
-    def signed(cls) -> bool:
-        return False
+    signed = False
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 4
+    load_size = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrbImmediateT1(BaseInstructionLdrImmediate):
     # A6.7.29 LDRB (immediate) T1
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 1
+    load_size = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrbRegisterT1(BaseInstructionLdrRegister):
     # A6.7.30 LDRB (register) T1
 
-    @classmethod
-    def signed(cls) -> bool:
-        return False
+    signed = False
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 1
+    load_size = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrhImmediateT1(BaseInstructionLdrImmediate):
     # A6.7.31 LDRH (immediate) T1
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 2
+    load_size = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrhRegisterT1(BaseInstructionLdrRegister):
     # A6.7.32 LDRH (register) T1
 
-    @classmethod
-    def signed(cls) -> bool:
-        return False
+    signed = False
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 2
+    load_size = 2
 
     def __str__(self) -> str:
         return f"LDRH {self.t}, [{self.n}, {self.m}]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrsbRegisterT1(BaseInstructionLdrRegister):
     # A6.7.33 LDRSB (register) T1
 
-    @classmethod
-    def signed(cls) -> bool:
-        return True
+    signed = True
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 1
+    load_size = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLdrshRegisterT1(BaseInstructionLdrRegister):
     # A6.7.34 LDRSH (register) T1
 
-    @classmethod
-    def signed(cls) -> bool:
-        return True
+    signed = True
 
-    @classmethod
-    def load_size(cls) -> int:
-        return 2
+    load_size = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLslImmediateT1(BaseInstructionD3M3Imm):
     # A6.7.35 LSL (immediate) T1
-    def __post_init__(self) -> None:
-        assert self.imm != 0
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.imm != 0
 
     def __str__(self) -> str:
         return f"LSLS {self.d}, {self.m}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLslRegisterT1(BaseInstructionDn3M3):
     # A6.7.36 LSL (register) T1
 
@@ -815,7 +796,7 @@ class InstructionLslRegisterT1(BaseInstructionDn3M3):
         return f"LSLS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLsrImmediateT1(BaseInstructionD3M3Imm):
     # A6.7.37 LSR (immediate) T1
 
@@ -823,7 +804,7 @@ class InstructionLsrImmediateT1(BaseInstructionD3M3Imm):
         return f"LSRS {self.d}, {self.m}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionLsrRegisterT1(BaseInstructionDn3M3):
     # A6.7.38 LSR (register) T1
 
@@ -831,7 +812,7 @@ class InstructionLsrRegisterT1(BaseInstructionDn3M3):
         return f"LSRS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMovImmediateT1(BaseInstructionD3Imm):
     # A6.7.39 MOV (immediate) T1
 
@@ -839,7 +820,7 @@ class InstructionMovImmediateT1(BaseInstructionD3Imm):
         return f"MOVS {self.d}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMovRegisterT1(Instruction16):
     # A6.7.40 MOV (register) T1
     d: Register4
@@ -849,10 +830,10 @@ class InstructionMovRegisterT1(Instruction16):
         return f"MOV {self.d}, {self.m}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {self.d}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMovRegisterT2(BaseInstructionD3M3):
     # A6.7.40 MOV (register) T2
 
@@ -860,7 +841,7 @@ class InstructionMovRegisterT2(BaseInstructionD3M3):
         return f"MOVS {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMulT1(Instruction16):
     # A6.7.44 MUL T1
     # TODO: add register/immediate/literal?
@@ -871,10 +852,10 @@ class InstructionMulT1(Instruction16):
         return f"MULS {self.dm}, {self.n}, {self.dm}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.dm)}
+        return AFFECTS_REGISTERS_SINGLE[self.dm]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMvnRegisterT1(BaseInstructionD3M3):
     # A6.7.45 MVN (register) T1
 
@@ -882,18 +863,15 @@ class InstructionMvnRegisterT1(BaseInstructionD3M3):
         return f"MVNS {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionNopT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionNopT1(AffectsRegistersNone, Instruction16):
     # A6.7.47 NOP T1
 
     def __str__(self) -> str:
         return "NOP"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionOrrRegisterT1(BaseInstructionDn3M3):
     # A6.7.48 ORR (register) T1
 
@@ -901,51 +879,50 @@ class InstructionOrrRegisterT1(BaseInstructionDn3M3):
         return f"ORRS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionPopT1(Instruction16):
     # A6.7.49 POP T1
     pc: bool
     registers3: Set[Register3]
 
-    def __post_init__(self) -> None:
-        assert self.pc or self.registers3
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.pc or self.registers3
 
     def __str__(self) -> str:
         return f"POP {{{', '.join(chain(
-            (str(register3) for register3 in Register3 if register3 in self.registers3),
+            (str(register3) for register3 in sorted(self.registers3)),
             [str(Register4.PC)] if self.pc else [],
         ))}}}"
 
     def affects_registers(self) -> Set[Register4]:
-        return set(
-            chain(
-                [Register4.PC] if self.pc else [],
-                (Register4.from_register3(register3) for register3 in self.registers3),
-                [Register4.SP],
-            )
-        )
+        try:
+            return AFFECTS_REGISTERS_POP[self.pc][self.registers3]
+        except (KeyError, TypeError):
+            # register list not coming from the decoder (not interned, possibly unhashable)
+            return affects_registers_pop(self.pc, self.registers3)
 
 
-@dataclass(frozen=True)
-class InstructionPushT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionPushT1(AffectsRegistersSp, Instruction16):
     # A6.7.50 PUSH T1
     lr: bool
     registers3: Set[Register3]
 
-    def __post_init__(self) -> None:
-        assert self.lr or self.registers3
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.lr or self.registers3
 
     def __str__(self) -> str:
         return f"PUSH {{{', '.join(chain(
-            (str(register3) for register3 in Register3 if register3 in self.registers3),
+            (str(register3) for register3 in sorted(self.registers3)),
             [str(Register4.LR)] if self.lr else [],
         ))}}}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.SP}
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionRevT1(BaseInstructionD3M3):
     # A6.7.51 REV T1
     # TODO: add register/immediate/literal?
@@ -954,7 +931,7 @@ class InstructionRevT1(BaseInstructionD3M3):
         return f"REV {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionRev16T1(BaseInstructionD3M3):
     # A6.7.52 REV16 T1
     # TODO: add register/immediate/literal?
@@ -963,7 +940,7 @@ class InstructionRev16T1(BaseInstructionD3M3):
         return f"REV16 {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionRevshT1(BaseInstructionD3M3):
     # A6.7.53 REVSH T1
     # TODO: add register/immediate/literal?
@@ -972,7 +949,7 @@ class InstructionRevshT1(BaseInstructionD3M3):
         return f"REVSH {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionRorRegisterT1(BaseInstructionDn3M3):
     # A6.7.54 ROR (register) T1
 
@@ -980,7 +957,7 @@ class InstructionRorRegisterT1(BaseInstructionDn3M3):
         return f"RORS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionRsbImmediateT1(Instruction16):
     # A6.7.55 RSB (immediate) T1
     d: Register3
@@ -990,10 +967,10 @@ class InstructionRsbImmediateT1(Instruction16):
         return f"RSBS {self.d}, {self.n}, #0"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.d)}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSbcRegisterT1(BaseInstructionDn3M3):
     # A6.7.56 SBC (register) T1
 
@@ -1001,104 +978,88 @@ class InstructionSbcRegisterT1(BaseInstructionDn3M3):
         return f"SBCS {self.dn}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionSevT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionSevT1(AffectsRegistersNone, Instruction16):
     # A6.7.57 SEV T1
 
     def __str__(self) -> str:
         return "SEV"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStmT1(Instruction16):
     # A6.7.58 STM, STMIA, STMEA T1
     # TODO: add register/immediate/literal?
     n: Register3
     registers: Set[Register3]
 
-    def __post_init__(self) -> None:
-        assert self.registers
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.registers
 
     def __str__(self) -> str:
         return f"STM {self.n}!, {{{''.join(
-            str(register3) for register3 in Register3 if register3 in self.registers
+            str(register3) for register3 in sorted(self.registers)
         )}}}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {Register4.from_register3(self.n)}
+        return AFFECTS_REGISTERS_SINGLE[self.n]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrImmediateT1(BaseInstructionStrImmediate):
     # A6.7.59 STR (immediate) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 4
+    store_size = 4
 
 
-@dataclass(frozen=True)
-class InstructionStrImmediateT2(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionStrImmediateT2(AffectsRegistersNone, Instruction16):
     # A6.7.59 STR (immediate) T2
     t: Register3
-    imm: int  # NOTE: multiplied by 4
+    imm: int  # NOTE: already multiplied by 4
 
     def __str__(self) -> str:
-        return f"STR {self.t}, [SP{f', #0x{(self.imm * 4):0X}' if self.imm else ''}]"
-
-    def affects_registers(self) -> Set[Register4]:
-        return set()
+        return f"STR {self.t}, [SP{f', #0x{self.imm:0X}' if self.imm else ''}]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrRegisterT1(BaseInstructionStrRegister):
     # A6.7.60 STR (register) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 4
+    store_size = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrbImmediateT1(BaseInstructionStrImmediate):
     # A6.7.61 STRB (immediate) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 1
+    store_size = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrbRegisterT1(BaseInstructionStrRegister):
     # A6.7.62 STRB (register) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 1
+    store_size = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrhImmediateT1(BaseInstructionStrImmediate):
     # A6.7.63 STRH (immediate) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 2
+    store_size = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionStrhRegisterT1(BaseInstructionStrRegister):
     # A6.7.64 STRH (register) T1
 
-    @classmethod
-    def store_size(cls) -> int:
-        return 2
+    store_size = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSubImmediateT1(BaseInstructionD3N3Imm):
     # A6.7.65 SUB (immediate) T1
 
@@ -1106,7 +1067,7 @@ class InstructionSubImmediateT1(BaseInstructionD3N3Imm):
         return f"SUBS {self.d}, {self.n}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSubImmediateT2(BaseInstructionDn3Imm):
     # A6.7.65 SUB (immediate) T2
 
@@ -1114,7 +1075,7 @@ class InstructionSubImmediateT2(BaseInstructionDn3Imm):
         return f"SUBS {self.dn}, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSubRegisterT1(BaseInstructionD3N3M3):
     # A6.7.66 SUB (register) T1
 
@@ -1122,20 +1083,17 @@ class InstructionSubRegisterT1(BaseInstructionD3N3M3):
         return f"SUBS {self.d}, {self.n}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionSubSpMinusImmediateT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionSubSpMinusImmediateT1(AffectsRegistersSp, Instruction16):
     # A6.7.67 SUB (SP minus immediate) T1
-    imm: int  # NOTE: multiplied by 4
+    imm: int  # NOTE: already multiplied by 4
 
     def __str__(self) -> str:
-        return f"SUB SP, SP, #0x{(self.imm * 4):0X}"
-
-    def affects_registers(self) -> Set[Register4]:
-        return {Register4.SP}
+        return f"SUB SP, SP, #0x{self.imm:0X}"
 
 
-@dataclass(frozen=True)
-class InstructionSvcT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionSvcT1(AffectsRegistersNone, Instruction16):
     # A6.7.68 SVC T1
     # TODO: add register/immediate/literal?
     imm: int
@@ -1143,11 +1101,8 @@ class InstructionSvcT1(Instruction16):
     def __str__(self) -> str:
         return f"SVC #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSxtbT1(BaseInstructionD3M3):
     # A6.7.69 SXTB T1
     # TODO: add register/immediate/literal?
@@ -1156,7 +1111,7 @@ class InstructionSxtbT1(BaseInstructionD3M3):
         return f"SXTB {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionSxthT1(BaseInstructionD3M3):
     # A6.7.70 SXTH T1
     # TODO: add register/immediate/literal?
@@ -1165,7 +1120,7 @@ class InstructionSxthT1(BaseInstructionD3M3):
         return f"SXTH {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionTstRegisterT1(BaseInstructionN3M3):
     # A6.7.71 TST (register) T1
 
@@ -1173,8 +1128,8 @@ class InstructionTstRegisterT1(BaseInstructionN3M3):
         return f"TST {self.n}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionUdfT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionUdfT1(AffectsRegistersNone, Instruction16):
     # A6.7.72 UDF T1
     # TODO: add register/immediate/literal?
     imm: int
@@ -1182,12 +1137,9 @@ class InstructionUdfT1(Instruction16):
     def __str__(self) -> str:
         return f"UDF #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
 
-
-@dataclass(frozen=True)
-class InstructionUdfT2(Instruction32):
+@dataclass(frozen=True, slots=True)
+class InstructionUdfT2(AffectsRegistersNone, Instruction32):
     # A6.7.72 UDF T2
     # TODO: add register/immediate/literal?
     imm: int
@@ -1195,11 +1147,8 @@ class InstructionUdfT2(Instruction32):
     def __str__(self) -> str:
         return f"UDF.W #0x{self.imm:0X}"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionUxtbT1(BaseInstructionD3M3):
     # A6.7.73 UXTB T1
     # TODO: add register/immediate/literal?
@@ -1208,7 +1157,7 @@ class InstructionUxtbT1(BaseInstructionD3M3):
         return f"UXTB {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionUxthT1(BaseInstructionD3M3):
     # A6.7.74 UXTH T1
     # TODO: add register/immediate/literal?
@@ -1217,79 +1166,68 @@ class InstructionUxthT1(BaseInstructionD3M3):
         return f"UXTH {self.d}, {self.m}"
 
 
-@dataclass(frozen=True)
-class InstructionWfeT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionWfeT1(AffectsRegistersNone, Instruction16):
     # A6.7.75 WFE T1
 
     def __str__(self) -> str:
         return "WFE"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
-class InstructionWfiT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionWfiT1(AffectsRegistersNone, Instruction16):
     # A6.7.76 WFI T1
 
     def __str__(self) -> str:
         return "WFI"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
-class InstructionYieldT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionYieldT1(AffectsRegistersNone, Instruction16):
     # A6.7.77 YIELD T1
 
     def __str__(self) -> str:
         return "YIELD"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
-class InstructionCpsT1(Instruction16):
+@dataclass(frozen=True, slots=True)
+class InstructionCpsT1(AffectsRegistersNone, Instruction16):
     # B4.2.1 CPS T1
     im: bool
 
     def __str__(self) -> str:
         return f"CPSI{'E' if self.im else 'D'} i"
 
-    def affects_registers(self) -> Set[Register4]:
-        return set()
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstructionMrsT1(Instruction32):
     # B4.2.2 MRS T1
     # TODO: add register/immediate/literal?
     d: Register4
     sys_m: SysM
 
-    def __post_init__(self) -> None:
-        assert self.d not in (Register4.SP, Register4.PC)
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.d not in (Register4.SP, Register4.PC)
 
     def __str__(self) -> str:
         return f"MRS {self.d}, {self.sys_m}"
 
     def affects_registers(self) -> Set[Register4]:
-        return {self.d}
+        return AFFECTS_REGISTERS_SINGLE[self.d]
 
 
-@dataclass(frozen=True)
-class InstructionMsrRegisterT1(Instruction32):
+@dataclass(frozen=True, slots=True)
+class InstructionMsrRegisterT1(AffectsRegistersNone, Instruction32):
     # B4.2.3 MSR (register) T1
     sys_m: SysM
     n: Register4
 
-    def __post_init__(self) -> None:
-        assert self.n not in (Register4.SP, Register4.PC)
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            assert self.n not in (Register4.SP, Register4.PC)
 
     def __str__(self) -> str:
         return f"MSR {self.sys_m}, {self.n}"
-
-    def affects_registers(self) -> Set[Register4]:
-        return set()
@@ -1,57 +1,62 @@
+import struct
 from collections.abc import Generator, Sequence, Set
-from itertools import chain
-
-from more_itertools import chunked_even
+from functools import lru_cache
 
 from . import model
 
 
 def instructions_from_opcodes(opcodes_bytes: bytes) -> Generator[model.Instruction]:
-    opcodes_halfword_iterator = chunked_even(opcodes_bytes, 2)
+    if len(opcodes_bytes) % 2 != 0:
+        raise ValueError("opcodes must consist of whole halfwords.")
 
-    while True:
-        try:
-            opcode_halfword_bytes = next(opcodes_halfword_iterator)
-        except StopIteration:
-            break
+    opcodes_halfword_iterator = iter(struct.unpack(f"<{len(opcodes_bytes) // 2}H", opcodes_bytes))
 
+    for opcode_halfword in opcodes_halfword_iterator:
         instruction: model.Instruction
 
         # A5.1 Thumb instruction set encoding
-        if opcode_halfword_bytes[1] >> 3 in (0b11101, 0b11110, 0b11111):
+        if opcode_halfword >> 11 >= 0b11101:  # 0b11101, 0b11110 or 0b11111
             # this is 32 bit instruction
             try:
-                opcode_halfword_bytes_2 = next(opcodes_halfword_iterator)
+                opcode_halfword_2 = next(opcodes_halfword_iterator)
             except StopIteration:
                 raise ValueError("32 bit instruction ended prematurely.")  # pylint: disable=raise-missing-from
 
-            opcode_word = int.from_bytes(chain(opcode_halfword_bytes_2, opcode_halfword_bytes), "little")
+            opcode_word = (opcode_halfword << 16) | opcode_halfword_2
 
             try:
                 instruction = instruction_from_opcode_word(opcode_word)
             except (model.InstructionUndefined, model.InstructionUnpredictable) as exception:
                 exception.add_note(f"opcode: {opcode_word:08X}")
                 raise
-
-            assert instruction.size() == 4
         else:
             # this is 16 bit instruction
-            opcode_halfword = int.from_bytes(opcode_halfword_bytes, "little")
-
             try:
                 instruction = instruction_from_opcode_halfword(opcode_halfword)
             except (model.InstructionUndefined, model.InstructionUnpredictable) as exception:
                 exception.add_note(f"opcode: {opcode_halfword:04X}")
                 raise
 
-            assert instruction.size() == 2
-
         yield instruction
 
 
+# instructions are immutable, so repeated encodings share a single decoded instance, indexed by the halfword and
+# filled on first use
+_INSTRUCTIONS_BY_OPCODE_HALFWORD: list[model.Instruction16 | None] = [None] * (1 << 16)
+
+
 def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction16:
     assert 0 <= opcode_halfword < (1 << 16)
 
+    instruction = _INSTRUCTIONS_BY_OPCODE_HALFWORD[opcode_halfword]
+    if instruction is None:
+        instruction = _INSTRUCTIONS_BY_OPCODE_HALFWORD[opcode_halfword] = instruction_from_opcode_halfword_decode(
+            opcode_halfword
+        )
+    return instruction
+
+
+def instruction_from_opcode_halfword_decode(opcode_halfword: int) -> model.Instruction16:
     # A5.2 16-bit Thumb instruction encoding
     opcode_1 = _bits_msb_from_int(opcode_halfword >> 10, 6)
     match opcode_1:
@@ -299,7 +304,7 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
         case [False, True, False, False, True, _]:
             # A6.7.27 LDR (literal) T1
             rt = _register3_from_opcode(opcode_halfword, 8)
-            imm = _imm_from_opcode(opcode_halfword, 8, 0)
+            imm = _imm_from_opcode(opcode_halfword, 8, 0) * 4
 
             return model.InstructionLdrLiteralT1(rt, imm)
         case [False, True, False, True, _, _] | [False, True, True, _, _, _] | [True, False, False, _, _, _]:
@@ -342,7 +347,7 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
                             assert False
                     assert False
                 case [False, True, True, False]:
-                    imm = _imm_from_opcode(opcode_halfword, 5, 6)
+                    imm = _imm_from_opcode(opcode_halfword, 5, 6) * 4
                     rn = _register3_from_opcode(opcode_halfword, 3)
                     rt = _register3_from_opcode(opcode_halfword, 0)
 
@@ -372,7 +377,7 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
                             assert False
                     assert False
                 case [True, False, False, False]:
-                    imm = _imm_from_opcode(opcode_halfword, 5, 6)
+                    imm = _imm_from_opcode(opcode_halfword, 5, 6) * 2
                     rn = _register3_from_opcode(opcode_halfword, 3)
                     rt = _register3_from_opcode(opcode_halfword, 0)
 
@@ -388,7 +393,7 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
                     assert False
                 case [True, False, False, True]:
                     rt = _register3_from_opcode(opcode_halfword, 8)
-                    imm = _imm_from_opcode(opcode_halfword, 8, 0)
+                    imm = _imm_from_opcode(opcode_halfword, 8, 0) * 4
 
                     match opcode_b:
                         case [False, _, _]:
@@ -406,13 +411,13 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
         case [True, False, True, False, False, _]:
             # A6.7.6 ADR T1
             rd = _register3_from_opcode(opcode_halfword, 8)
-            imm = _imm_from_opcode(opcode_halfword, 8, 0)
+            imm = _imm_from_opcode(opcode_halfword, 8, 0) * 4
 
             return model.InstructionAdrT1(rd, imm)
         case [True, False, True, False, True, _]:
             # A6.7.4 ADD (SP plus immediate) T1
             rd = _register3_from_opcode(opcode_halfword, 8)
-            imm = _imm_from_opcode(opcode_halfword, 8, 0)
+            imm = _imm_from_opcode(opcode_halfword, 8, 0) * 4
 
             return model.InstructionAddSpPlusImmediateT1(rd, imm)
         case [True, False, True, True, _, _]:
@@ -421,12 +426,12 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
             match opcode_2:
                 case [False, False, False, False, False, _, _]:
                     # A6.7.4 ADD (SP plus immediate) T2
-                    imm = _imm_from_opcode(opcode_halfword, 7, 0)
+                    imm = _imm_from_opcode(opcode_halfword, 7, 0) * 4
 
                     return model.InstructionAddSpPlusImmediateT2(imm)
                 case [False, False, False, False, True, _, _]:
                     # A6.7.67 SUB (SP minus immediate) T1
-                    imm = _imm_from_opcode(opcode_halfword, 7, 0)
+                    imm = _imm_from_opcode(opcode_halfword, 7, 0) * 4
 
                     return model.InstructionSubSpMinusImmediateT1(imm)
                 case [False, False, True, False, False, False, _]:
@@ -503,7 +508,7 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
                     # Hint instructions
                     opcode_a = _bits_msb_from_int(opcode_halfword >> 4, 4)
                     opcode_b = _bits_msb_from_int(opcode_halfword >> 0, 4)
-                    if opcode_b != [False, False, False, False]:
+                    if any(opcode_b):
                         raise model.InstructionUndefined()
                     match opcode_a:
                         case [False, False, False, False]:
@@ -560,14 +565,14 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
                     return model.InstructionSvcT1(imm)
                 case _:
                     # A6.7.10 B T1
-                    cond = model.Condition(_imm_from_opcode(opcode_halfword, 4, 8))
-                    imm = _imm_from_opcode(opcode_halfword, 8, 0, True)
+                    cond = _CONDITIONS[_imm_from_opcode(opcode_halfword, 4, 8)]
+                    imm = _imm_from_opcode(opcode_halfword, 8, 0, True) * 2
 
                     return model.InstructionBT1(cond, imm)
             assert False
         case [True, True, True, False, False, _]:
             # A6.7.10 B T2
-            imm = _imm_from_opcode(opcode_halfword, 11, 0, True)
+            imm = _imm_from_opcode(opcode_halfword, 11, 0, True) * 2
 
             return model.InstructionBT2(imm)
         case _:
@@ -575,6 +580,8 @@ def instruction_from_opcode_halfword(opcode_halfword: int) -> model.Instruction1
     assert False
 
 
+# 32 bit opcodes are too sparse for a full table, recently seen ones (calls to the same target etc.) are kept
+@lru_cache(maxsize=1 << 16)
 def instruction_from_opcode_word(opcode_word: int) -> model.Instruction32:
     assert 0 <= opcode_word < (1 << 32)
 
@@ -646,16 +653,16 @@ def instruction_from_opcode_word(opcode_word: int) -> model.Instruction32:
                             assert False
                         case [True, _, True]:
                             # A6.7.13 BL T1
-                            s = (opcode_word >> 26) & 0b1 == 1
-                            imm10 = _bits_msb_from_int(opcode_word >> 16, 10)
-                            j1 = (opcode_word >> 13) & 0b1 == 1
-                            j2 = (opcode_word >> 11) & 0b1 == 1
-                            imm11 = _bits_msb_from_int(opcode_word, 11)
+                            s = (opcode_word >> 26) & 0b1
+                            imm10 = _imm_from_opcode(opcode_word, 10, 16)
+                            j1 = (opcode_word >> 13) & 0b1
+                            j2 = (opcode_word >> 11) & 0b1
+                            imm11 = _imm_from_opcode(opcode_word, 11, 0)
 
-                            i1 = not j1 ^ s
-                            i2 = not j2 ^ s
+                            i1 = (j1 ^ s) ^ 0b1  # NOT(J1 EOR S)
+                            i2 = (j2 ^ s) ^ 0b1  # NOT(J2 EOR S)
 
-                            imm = _sint_from_bits_msb([s, i1, i2, *imm10, *imm11])
+                            imm = _sint_from_uint((s << 23) | (i1 << 22) | (i2 << 21) | (imm10 << 11) | imm11, 24) * 2
 
                             return model.InstructionBlT1(imm)
                         case _:
@@ -671,63 +678,62 @@ def instruction_from_opcode_word(opcode_word: int) -> model.Instruction32:
     assert False
 
 
+# all bit patterns up to 11 bits wide (the widest opcode field matched), indexed by width and then by value
+_BITS_MSB_BY_OUTPUT_BITS: Sequence[Sequence[Sequence[bool]]] = tuple(
+    tuple(
+        tuple(bool(input_ & (1 << (output_bits - bit - 1))) for bit in range(output_bits))
+        for input_ in range(1 << output_bits)
+    )
+    for output_bits in range(12)
+)
+
+
 def _bits_msb_from_int(input_: int, output_bits: int) -> Sequence[bool]:
     """
     Converts `input_` integer into `output_bits` of boolean bits, assuming that first output value is MSB.
     """
 
-    output = [False] * output_bits
-
-    for bit in range(output_bits):
-        output[bit] = bool(input_ & (1 << (output_bits - bit - 1)))
-
-    return output
+    return _BITS_MSB_BY_OUTPUT_BITS[output_bits][input_ & ((1 << output_bits) - 1)]
 
 
-def _sint_from_bits_msb(bits: Sequence[bool]) -> int:
+def _sint_from_uint(input_: int, bits: int) -> int:
     """
-    Converts `bits` into integer, assuming MSB go first and the value is signed.
+    Converts `bits` wide unsigned `input_` into signed integer, treating its MSB as the sign bit.
     """
-    assert bits
 
-    output = 0
-    for shift, bit in enumerate(reversed(bits)):
-        if bit:
-            output |= 1 << shift
+    sign = 1 << (bits - 1)
+    return (input_ ^ sign) - sign
 
-    if bits[0]:
-        output = output - (1 << len(bits))
 
-    return output
+# enum members indexed by value (all of them are contiguous from 0), to skip the enum constructor lookup
+_REGISTERS3: Sequence[model.Register3] = tuple(model.Register3)
+_REGISTERS4: Sequence[model.Register4] = tuple(model.Register4)
+_CONDITIONS: Sequence[model.Condition] = tuple(model.Condition)
 
 
 def _register3_from_opcode(opcode: int, lsb_index: int) -> model.Register3:
     """
     Takes 3 bits, starting from `lsb_index` from `opcode` and converts them to 3-bit register (0-7).
     """
-    return model.Register3((opcode >> lsb_index) & 0b111)
+    return _REGISTERS3[(opcode >> lsb_index) & 0b111]
 
 
 def _registers3_from_opcode(opcode: int) -> Set[model.Register3]:
-    registers3 = set[model.Register3]()
-    for register3 in model.Register3:
-        if opcode & (1 << register3.value):
-            registers3.add(register3)
-    return registers3
+    return model.REGISTERS3_BY_MASK[opcode & 0b11111111]
 
 
 def _register4_from_opcode(opcode: int, lsb_index: int) -> model.Register4:
     """
     Takes 4 bits, starting from `lsb_index` from `opcode` and converts them to 4-bit register (0-15).
     """
-    return model.Register4((opcode >> lsb_index) & 0b1111)
+    return _REGISTERS4[(opcode >> lsb_index) & 0b1111]
 
 
 def _register4_7210_from_opcode(opcode: int) -> model.Register4:
     """
     Converts bits 7, 2, 1, 0 of `opcode` into 4-bit register (0-15).
     """
-    return model.Register4(((opcode >> 4) & 0b1000) | (opcode & 0b111))
+    return _REGISTERS4[((opcode >> 4) & 0b1000) | (opcode & 0b111)]
 
 
 def _imm_from_opcode(opcode: int, width: int, lsb_index: int, signed: bool = False) -> int:
@@ -737,6 +743,6 @@ def _imm_from_opcode(opcode: int, width: int, lsb_index: int, signed: bool = Fal
     """
 
     imm = (opcode >> lsb_index) & ((1 << width) - 1)
-    if signed and (opcode & (1 << (lsb_index + width - 1))) > 0:
-        imm = imm - (1 << width)
+    if signed:
+        imm = _sint_from_uint(imm, width)
     return imm
@@ -118,5 +118,5 @@ def _assert_one_of[T](property_: str, actual: T, expecteds: Collection[T]) -> No
         raise ValueError(
             f"Expecting {property_} to be one of "
             f"{", ".join(f"`{expected}`" for expected in expecteds)}, "
-            "but got `{actual}`"
+            f"but got `{actual}`"
         )
@@ -1,13 +1,12 @@
-from collections.abc import Collection, Mapping, Set
-from dataclasses import dataclass
-from functools import cached_property
+from collections.abc import Collection, Mapping, Sequence, Set
+from dataclasses import dataclass, field
 
 from more_itertools import all_unique, is_sorted
 
 from ..common import Address
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Function:
     address: Address
     names: Set[str]
@@ -17,37 +16,44 @@ class Function:
 
     call_addresses: Set[Address]
 
-    def __post_init__(self) -> None:
-        # must be positive
-        assert self.address >= 0
+    if __debug__:
 
-        # must be aligned
-        assert self.address % 2 == 0
+        def __post_init__(self) -> None:
+            # must be positive
+            assert self.address >= 0
 
-        # must have at least one name
-        assert self.names
+            # must be aligned
+            assert self.address % 2 == 0
 
-        # stack grow must be positive
-        assert self.stack_grow >= 0
+            # must have at least one name
+            assert self.names
+
+            # stack grow must be positive
+            assert self.stack_grow >= 0
 
-        # stack must be word-aligned
-        assert self.stack_grow % 4 == 0
+            # stack must be word-aligned
+            assert self.stack_grow % 4 == 0
 
-        # cumulative stack grow must be at least equal to our stack grow
-        assert self.stack_grow_cumulative >= self.stack_grow
+            # cumulative stack grow must be at least equal to our stack grow
+            assert self.stack_grow_cumulative >= self.stack_grow
 
-        # cumulative stack grow must be aligned
-        assert self.stack_grow_cumulative % 4 == 0
+            # cumulative stack grow must be aligned
+            assert self.stack_grow_cumulative % 4 == 0
 
-        # call addresses (if any) must be aligned
-        assert all(call_address % 2 == 0 for call_address in self.call_addresses)
+            # call addresses (if any) must be aligned
+            assert all(call_address % 2 == 0 for call_address in self.call_addresses)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Functions:
-    inner: Collection[Function]
+    inner: Sequence[Function]
+
+    # needed below for call addresses check, and by Program to check entrypoints
+    by_address: Mapping[Address, Function] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "by_address", {function.address: function for function in self.inner})
+
         # must be sorted
         assert is_sorted(
             (function.address for function in self.inner),
@@ -65,12 +71,8 @@ class Functions:
         # calls must not cycle
         # NOTE: this is somehow guaranteed by existence of cumulative stack size
 
-    @cached_property
-    def by_address(self) -> Mapping[Address, Function]:
-        return {function.address: function for function in self.inner}
 
-
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Entrypoint:
     address: Address
     name: str
@@ -79,21 +81,23 @@ class Entrypoint:
     # including 8x4-byte for exceptions (B1.5.6 Exception entry behavior)
     stack_grow: int
 
-    def __post_init__(self) -> None:
-        # must be positive
-        assert self.address >= 0
+    if __debug__:
 
-        # must be aligned
-        assert self.address % 2 == 0
+        def __post_init__(self) -> None:
+            # must be positive
+            assert self.address >= 0
 
-        # stack grow must be positive
-        assert self.stack_grow >= 0
+            # must be aligned
+            assert self.address % 2 == 0
 
-        # stack must be 8-byte aligned
-        assert self.stack_grow % 8 == 0
+            # stack grow must be positive
+            assert self.stack_grow >= 0
+
+            # stack must be 8-byte aligned
+            assert self.stack_grow % 8 == 0
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EntrypointsPriorityGroup:
     entrypoints: Collection[Entrypoint]
     name: str
@@ -101,25 +105,40 @@ class EntrypointsPriorityGroup:
     # worst-case scenario for this group
     stack_grow: int
 
-    def __post_init__(self) -> None:
-        # group must have at least one entrypoint
-        assert self.entrypoints
+    if __debug__:
 
-        # stack grow must be positive
-        assert self.stack_grow >= 0
+        def __post_init__(self) -> None:
+            # group must have at least one entrypoint
+            assert self.entrypoints
 
-        # stack must be 8-byte aligned
-        assert self.stack_grow % 8 == 0
+            # stack grow must be positive
+            assert self.stack_grow >= 0
 
+            # stack must be 8-byte aligned
+            assert self.stack_grow % 8 == 0
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Entrypoints:
     priority_groups: Collection[EntrypointsPriorityGroup]
 
     # whole program worst-case scenario
     stack_size: int
 
+    # needed by Program to check entrypoints against functions
+    addresses: Set[Address] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "addresses",
+            frozenset(
+                entrypoint.address
+                for priority_group in self.priority_groups
+                for entrypoint in priority_group.entrypoints
+            ),
+        )
+
         # there must be at least one priority group
         assert self.priority_groups
 
@@ -130,18 +149,16 @@ class Entrypoints:
         assert self.stack_size % 8 == 0
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Program:
     functions: Functions
     entrypoints: Entrypoints
 
-    def __post_init__(self) -> None:
-        # all entrypoints must point to valid functions
-        assert {
-            entrypoint.address
-            for priority_group in self.entrypoints.priority_groups
-            for entrypoint in priority_group.entrypoints
-        } <= self.functions.by_address.keys()
+    if __debug__:
+
+        def __post_init__(self) -> None:
+            # all entrypoints must point to valid functions
+            assert self.entrypoints.addresses <= self.functions.by_address.keys()
 
     @property
     def stack_size(self) -> int:
@@ -1,6 +1,5 @@
 from collections.abc import Mapping, Set
 from logging import getLogger
-from math import ceil
 
 from ..common import Address, function_like_format
 from ..entrypoints import model as parent_entrypoints
@@ -31,15 +30,13 @@ def parse(
 def warn_functions_unreachable(
     parent_functions_: parent_functions.Functions, entrypoints_addresses: Set[Address]
 ) -> None:
-    # start with all functions
-    function_addresses_not_called = {function.address for function in parent_functions_.inner}
+    # all called functions, collected in a single union
+    function_addresses_called = set[Address]().union(*(function.call_addresses for function in parent_functions_.inner))
 
-    # remove called
-    for function in parent_functions_.inner:
-        function_addresses_not_called -= function.call_addresses
-
-    # remove pointed by entrypoints
-    function_addresses_not_called -= entrypoints_addresses
+    # all functions, without called and pointed by entrypoints
+    function_addresses_not_called = (
+        parent_functions_.by_address.keys() - function_addresses_called - entrypoints_addresses
+    )
 
     # we should be left with not called
     for function_address_not_called in function_addresses_not_called:
@@ -54,7 +51,7 @@ def parse_functions(parent_functions_: parent_functions.Functions) -> Functions:
     stack_grow_cumulative_by_function_address = resolve_stack_grow_cumulative_by_function_address(parent_functions_)
 
     # build new functions
-    functions_ = [
+    functions_ = tuple(
         Function(
             address=parent_function.address,
             names=parent_function.names,
@@ -63,7 +60,7 @@ def parse_functions(parent_functions_: parent_functions.Functions) -> Functions:
             call_addresses=parent_function.call_addresses,
         )
         for parent_function in parent_functions_.inner
-    ]
+    )
 
     return Functions(functions_)
 
@@ -71,38 +68,43 @@ def parse_functions(parent_functions_: parent_functions.Functions) -> Functions:
 def resolve_stack_grow_cumulative_by_function_address(
     parent_functions_: parent_functions.Functions,
 ) -> Mapping[Address, int]:
-    stack_grow_cumulative_by_function_address = dict[Address, int]()
+    # functions are resolved callees first, starting from leaves (topological order of the call graph)
 
-    while True:
-        changed = False
-
-        # not yet resolved
-        functions_unresolved = [
-            function
-            for function in parent_functions_.inner
-            if function.address not in stack_grow_cumulative_by_function_address
-        ]
+    # {callee address: [caller address]}
+    function_addresses_callers_by_function_address = dict[Address, list[Address]]()
+    # {address: number of not yet resolved callees}
+    calls_unresolved_count_by_function_address = dict[Address, int]()
+    for function in parent_functions_.inner:
+        calls_unresolved_count_by_function_address[function.address] = len(function.call_addresses)
+        for call_address in function.call_addresses:
+            function_addresses_callers_by_function_address.setdefault(call_address, []).append(function.address)
+
+    # functions with all callees resolved
+    function_addresses_resolvable = [
+        function_address
+        for function_address, calls_unresolved_count in calls_unresolved_count_by_function_address.items()
+        if calls_unresolved_count == 0
+    ]
 
-        # try each unresolved function
-        for function in functions_unresolved:
-            # if all callees are not resolved - skip for now
-            if not function.call_addresses <= stack_grow_cumulative_by_function_address.keys():
-                continue
+    stack_grow_cumulative_by_function_address = dict[Address, int]()
 
-            # all our calls are resolved, so we can resolve ourselves
+    while function_addresses_resolvable:
+        function = parent_functions_.by_address[function_addresses_resolvable.pop()]
 
-            # our cumulative stack grow is our stack grow + stack grow of the biggest call
-            stack_grow_cumulative = function.stack_grow + max(
-                (stack_grow_cumulative_by_function_address[call_address] for call_address in function.call_addresses),
-                default=0,
-            )
+        # our cumulative stack grow is our stack grow + stack grow of the biggest call
+        stack_grow_cumulative = function.stack_grow + max(
+            (stack_grow_cumulative_by_function_address[call_address] for call_address in function.call_addresses),
+            default=0,
+        )
 
-            # store information that we have resolved ourselves
-            stack_grow_cumulative_by_function_address[function.address] = stack_grow_cumulative
-            changed = True
+        # store information that we have resolved ourselves
+        stack_grow_cumulative_by_function_address[function.address] = stack_grow_cumulative
 
-        if not changed:
-            break
+        # callers waiting only for us can be resolved now
+        for function_address_caller in function_addresses_callers_by_function_address.get(function.address, ()):
+            calls_unresolved_count_by_function_address[function_address_caller] -= 1
+            if calls_unresolved_count_by_function_address[function_address_caller] == 0:
+                function_addresses_resolvable.append(function_address_caller)
 
     # all functions must be resolved
     # if they are not - it means there is a cycle in the graph
@@ -178,7 +180,7 @@ def parse_entrypoint(entrypoint: parent_entrypoints.Entrypoint, functions: Funct
     stack_grow = function.stack_grow_cumulative
     if is_exception:
         stack_grow += 8 * 4
-    stack_grow = ceil(stack_grow / 8) * 8
+    stack_grow = (stack_grow + 7) & ~7
 
     return Entrypoint(
         address=function.address,
@@ -1,6 +1,7 @@
 from collections.abc import Collection, Set
 from dataclasses import dataclass
 from functools import cached_property
+from itertools import chain
 
 from more_itertools import is_sorted
 
@@ -69,12 +70,14 @@ class Entrypoints:
 
     @cached_property
     def addresses(self) -> Set[Address]:
-        return {
-            self.reset.address,
-            *({self.nmi.address} if self.nmi is not None else set()),
-            self.hardfault.address,
-            *({self.svcall.vector.address} if self.svcall is not None else set()),
-            *({self.pendsv.vector.address} if self.pendsv is not None else set()),
-            *({self.systick.vector.address} if self.systick is not None else set()),
-            *({interrupt.vector_with_priority_group.vector.address for interrupt in self.interrupts.inner}),
-        }
+        return frozenset(
+            chain(
+                [self.reset.address],
+                [self.nmi.address] if self.nmi is not None else [],
+                [self.hardfault.address],
+                [self.svcall.vector.address] if self.svcall is not None else [],
+                [self.pendsv.vector.address] if self.pendsv is not None else [],
+                [self.systick.vector.address] if self.systick is not None else [],
+                (interrupt.vector_with_priority_group.vector.address for interrupt in self.interrupts.inner),
+            )
+        )
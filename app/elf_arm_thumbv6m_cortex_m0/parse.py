@@ -1,6 +1,16 @@
 # cortex-m0(+) microcontroller with thumb v6-m isa
 
+import pickle
+from contextlib import suppress
+from dataclasses import dataclass
+from hashlib import blake2b
+from hmac import compare_digest
+from importlib import metadata
+from logging import getLogger
+from os import environ, replace
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Self
 
 from elftools.elf.elffile import ELFFile
 
@@ -12,22 +22,131 @@ from .config import Config
 from .entrypoints.parse import parse as entrypoints_parse
 from .program.parse import parse as program_parse
 
+_logger = getLogger(__name__)
+
+# when set, parsed programs are cached in this directory, keyed by elf file identity, config and analyzer version
+CACHE_PATH_ENVIRONMENT_VARIABLE = "STACK_DEPTH_ANALYZER_CACHE_PATH"
+# secret authenticating cache entries, required for caching, as entries are unpickled
+CACHE_KEY_ENVIRONMENT_VARIABLE = "STACK_DEPTH_ANALYZER_CACHE_KEY"
+
 
 def parse_path(elf_path: Path, config_path: Path | None) -> Program:
+    if config_path is not None:
+        with config_path.open("r") as config_file:
+            config = Config.model_validate_json(config_file.read())
+    else:
+        config = None
+
+    cache_entry = CacheEntry.from_environment(elf_path, config)
+    if cache_entry is not None:
+        program_cached = cache_entry.load()
+        if program_cached is not None:
+            return program_cached
+
     with elf_path.open("rb") as elf_file:
         elffile = ELFFile(elf_file)  # type: ignore
 
-        if config_path is not None:
-            with config_path.open("r") as config_file:
-                config = Config.model_validate_json(config_file.read())
-        else:
-            config = None
-
         program = parse(elffile, config)
 
+    if cache_entry is not None:
+        cache_entry.store(program)
+
     return program
 
 
+@dataclass(frozen=True, kw_only=True)
+class CacheEntry:
+    # cache is optional, so all failures are logged and handled as a miss
+
+    path: Path
+    key: bytes
+
+    @classmethod
+    def from_environment(cls, elf_path: Path, config: Config | None) -> Self | None:
+        cache_directory = environ.get(CACHE_PATH_ENVIRONMENT_VARIABLE)
+        if not cache_directory:
+            return None
+
+        cache_key = environ.get(CACHE_KEY_ENVIRONMENT_VARIABLE)
+        if not cache_key:
+            _logger.warning(
+                "%s is set, but %s is not. Caching disabled.",
+                CACHE_PATH_ENVIRONMENT_VARIABLE,
+                CACHE_KEY_ENVIRONMENT_VARIABLE,
+            )
+            return None
+
+        try:
+            analyzer_version = metadata.version("stack-depth-analyzer")
+        except metadata.PackageNotFoundError:
+            _logger.warning("stack-depth-analyzer is not installed as a package. Caching disabled.")
+            return None
+
+        elf_stat = elf_path.stat()
+        name = blake2b(
+            "\0".join(
+                (
+                    analyzer_version,
+                    str(elf_path.resolve()),
+                    str(elf_stat.st_mtime_ns),
+                    str(elf_stat.st_size),
+                    config.model_dump_json() if config is not None else "",
+                )
+            ).encode()
+        ).hexdigest()
+
+        return cls(
+            path=Path(cache_directory) / f"{name}.pkl",
+            key=blake2b(cache_key.encode()).digest(),
+        )
+
+    def mac(self, payload: bytes) -> bytes:
+        return blake2b(payload, key=self.key).digest()
+
+    def load(self) -> Program | None:
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exception:
+            _logger.warning("Cannot read cache entry %s: %s", self.path, exception)
+            return None
+
+        # entry is mac followed by pickled program, unpickled only when mac matches
+        mac_size = blake2b().digest_size
+        mac, payload = data[:mac_size], data[mac_size:]
+
+        program = None
+        if compare_digest(mac, self.mac(payload)):
+            with suppress(Exception):
+                program = pickle.loads(payload)
+
+        if not isinstance(program, Program):
+            _logger.warning("Discarding invalid cache entry %s", self.path)
+            with suppress(OSError):
+                self.path.unlink(missing_ok=True)
+            return None
+
+        return program
+
+    def store(self, program: Program) -> None:
+        payload = pickle.dumps(program)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            # temporary file is removed on exit, unless already moved into place
+            with NamedTemporaryFile("wb", dir=self.path.parent, suffix=".tmp", delete_on_close=False) as cache_file:
+                cache_file.write(self.mac(payload))
+                cache_file.write(payload)
+                cache_file.close()
+
+                # moved in a single step, so interrupted or concurrent runs never leave a partial entry
+                replace(cache_file.name, self.path)
+        except OSError as exception:
+            _logger.warning("Cannot store cache entry %s: %s", self.path, exception)
+
+
 def parse(elffile: ELFFile, config: Config | None) -> Program:
     validate_elffile(elffile)
 
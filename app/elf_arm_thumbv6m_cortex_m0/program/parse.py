@@ -1,6 +1,6 @@
 from collections.abc import Collection
-from itertools import chain, islice
-from math import ceil
+from heapq import nlargest
+from itertools import chain
 
 from app.elf_arm_thumbv6m.functions import model as parent_functions
 from app.elf_arm_thumbv6m.program.model import (
@@ -92,22 +92,19 @@ def parse_entrypoints(parent_entrypoints_: parent_entrypoints.Entrypoints, funct
 
     # now use heaviest PRIORITY_GROUPS
     entrypoints_priority_groups.extend(
-        islice(  # take only PRIORITY_GROUPS heaviest
-            sorted(  # sorted by stack usage, descending
-                chain(  # from combined known and unknown priorities
-                    (  # known priorities are grouped by priority
-                        resolve_entrypoint_priority_group(entrypoints, f"Priority Group #{priority_group}")
-                        for priority_group, entrypoints in entrypoints_priority_known.items()
-                    ),
-                    (  # unknown form individual groups
-                        resolve_entrypoint_priority_group([entrypoint], "Unknown priority group")
-                        for entrypoint in entrypoints_priority_unknown
-                    ),
+        nlargest(  # take only PRIORITY_GROUPS heaviest, by stack usage
+            PRIORITY_GROUPS,
+            chain(  # from combined known and unknown priorities
+                (  # known priorities are grouped by priority
+                    resolve_entrypoint_priority_group(entrypoints, f"Priority Group #{priority_group}")
+                    for priority_group, entrypoints in entrypoints_priority_known.items()
+                ),
+                (  # unknown form individual groups
+                    resolve_entrypoint_priority_group([entrypoint], "Unknown priority group")
+                    for entrypoint in entrypoints_priority_unknown
                 ),
-                key=lambda priority_group: priority_group.stack_grow,
-                reverse=True,  # from heaviest
             ),
-            PRIORITY_GROUPS,
+            key=lambda priority_group: priority_group.stack_grow,
         )
     )
 
@@ -137,7 +134,7 @@ def resolve_entrypoint_from_entrypoint_vector(
     stack_grow = function.stack_grow_cumulative
     if is_exception:
         stack_grow += 8 * 4
-    stack_grow = ceil(stack_grow / 8) * 8
+    stack_grow = (stack_grow + 7) & ~7
 
     return Entrypoint(
         address=function.address,